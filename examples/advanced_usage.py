@@ -261,8 +261,8 @@ def example_technique_analysis():
         # Validate combinations
         if niche_hooks and niche_structures:
             validation = db.validate_combination(
-                best_hook.hook_type.value,
-                best_structure.structure_type.value,
+                best_hook.hook_type,
+                best_structure.structure_type,
                 niche
             )
             print(f"   Compatibilidade: {validation['compatibility_score']:.2f}")
@@ -6,15 +6,65 @@ metadata, performance metrics, and content analysis.
 """
 
 import os
+import re
+import json
 import time
 import logging
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Mapping, Tuple, Union
 from datetime import datetime, timedelta
-from googleapiclient.discovery import build
+import numpy as np
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 import yaml
 
 
+# ISO 8601 duration, e.g. PT4M13S = 4 minutes 13 seconds
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+_NICHE_QUERIES: Mapping[str, Tuple[str, ...]] = {
+    "tecnologia": ("tecnologia", "programação", "apps", "gadgets", "inteligência artificial"),
+    "educacao": ("educação", "tutorial", "como fazer", "aprender", "curso"),
+    "negocios": ("empreendedorismo", "negócios", "marketing", "vendas", "dinheiro"),
+    "lifestyle": ("lifestyle", "rotina", "dicas", "vida", "bem-estar"),
+    "entretenimento": ("entretenimento", "diversão", "humor", "vlogs", "reacts")
+}
+
+
+_VIDEO_COUNT_FIELDS = ("viewCount", "likeCount", "commentCount")
+_CHANNEL_COUNT_FIELDS = ("subscriberCount", "videoCount", "viewCount")
+
+
+def _parse_counts(stats: Dict[str, Any], keys: Tuple[str, ...]) -> List[int]:
+    """Convert the string counters of an API statistics block to ints (missing -> 0)."""
+    get = stats.get
+    return [int(get(key) or 0) for key in keys]
+
+
+def _qualification_mask(views: np.ndarray,
+                        likes: np.ndarray,
+                        comments: np.ndarray,
+                        duration_seconds: np.ndarray,
+                        min_views: int,
+                        min_engagement_rate: float,
+                        max_duration_minutes: float) -> np.ndarray:
+    """Vectorized quality thresholds over per-video columns; returns a boolean mask."""
+    engagement_rate = (likes + comments) / np.maximum(views, 1)
+    return (
+        (views >= min_views)
+        & (engagement_rate >= min_engagement_rate)
+        & (duration_seconds <= max_duration_minutes * 60)
+    )
+
+
+@lru_cache(maxsize=None)
+def _load_discovery_document(service_name: str, version: str) -> Optional[Dict[str, Any]]:
+    """Load and parse the discovery document bundled with googleapiclient once per process."""
+    document = get_static_doc(service_name, version)
+    return json.loads(document) if document else None
+
+
 class YouTubeCollector:
     """Collects data from YouTube using the official API."""
     
@@ -24,10 +74,19 @@ class YouTubeCollector:
         if not self.api_key:
             raise ValueError("YouTube API key is required")
         
-        self.youtube = build("youtube", "v3", developerKey=self.api_key)
+        self.youtube = self._build_service("youtube", "v3")
         self.config = self._load_config(config_path)
         self.logger = self._setup_logging()
     
+    def _build_service(self, service_name: str, version: str):
+        """Build an API client from the cached discovery document."""
+        discovery_document = _load_discovery_document(service_name, version)
+        if discovery_document is None:
+            # Not bundled with this googleapiclient release: fetch it remotely
+            return build(service_name, version, developerKey=self.api_key, cache_discovery=False)
+        
+        return build_from_document(discovery_document, developerKey=self.api_key)
+    
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
@@ -71,13 +130,18 @@ class YouTubeCollector:
     def search_videos(self, 
                      query: str,
                      max_results: int = 50,
-                     published_after: Optional[datetime] = None,
+                     published_after: Optional[Union[datetime, str]] = None,
                      order: str = "relevance") -> List[Dict[str, Any]]:
-        """Search for videos based on query."""
+        """Search for videos based on query.
+        
+        ``published_after`` may be a datetime or an already formatted RFC 3339 string.
+        """
         try:
             # Set default published_after to 1 year ago if not provided
             if published_after is None:
-                published_after = datetime.now() - timedelta(days=365)
+                published_after = self._default_published_after()
+            elif isinstance(published_after, datetime):
+                published_after = published_after.isoformat() + "Z"
             
             search_params = {
                 "part": "snippet",
@@ -85,14 +149,15 @@ class YouTubeCollector:
                 "type": "video",
                 "order": order,
                 "maxResults": min(max_results, 50),  # API limit
-                "publishedAfter": published_after.isoformat() + "Z",
+                "publishedAfter": published_after,
                 "relevanceLanguage": "pt"  # Prioritize Portuguese content
             }
             
             response = self.youtube.search().list(**search_params).execute()
             
-            videos = []
-            for item in response["items"]:
+            items = response["items"]
+            videos = [None] * len(items)
+            for i, item in enumerate(items):
                 video_data = {
                     "video_id": item["id"]["videoId"],
                     "title": item["snippet"]["title"],
@@ -102,7 +167,7 @@ class YouTubeCollector:
                     "published_at": item["snippet"]["publishedAt"],
                     "thumbnails": item["snippet"]["thumbnails"]
                 }
-                videos.append(video_data)
+                videos[i] = video_data
             
             self.logger.info(f"Found {len(videos)} videos for query: {query}")
             return videos
@@ -114,6 +179,10 @@ class YouTubeCollector:
             self.logger.error(f"Error searching videos: {e}")
             return []
     
+    def _default_published_after(self) -> str:
+        """RFC 3339 timestamp for one year ago, the default search window."""
+        return (datetime.now() - timedelta(days=365)).isoformat() + "Z"
+    
     def get_video_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
         """Get detailed information for multiple videos."""
         all_details = []
@@ -139,16 +208,14 @@ class YouTubeCollector:
             
             response = self.youtube.videos().list(**video_params).execute()
             
-            videos = []
-            for item in response["items"]:
+            items = response["items"]
+            videos = [None] * len(items)
+            for i, item in enumerate(items):
                 # Parse duration
                 duration = self._parse_duration(item["contentDetails"]["duration"])
                 
                 # Calculate engagement rate
-                stats = item["statistics"]
-                views = int(stats.get("viewCount", 0))
-                likes = int(stats.get("likeCount", 0))
-                comments = int(stats.get("commentCount", 0))
+                views, likes, comments = _parse_counts(item["statistics"], _VIDEO_COUNT_FIELDS)
                 
                 engagement_rate = (likes + comments) / max(views, 1) if views > 0 else 0
                 
@@ -170,7 +237,7 @@ class YouTubeCollector:
                     "language": item["snippet"].get("defaultLanguage", "unknown"),
                     "made_for_kids": item["status"].get("madeForKids", False)
                 }
-                videos.append(video_data)
+                videos[i] = video_data
             
             return videos
             
@@ -183,11 +250,7 @@ class YouTubeCollector:
     
     def _parse_duration(self, duration_str: str) -> int:
         """Parse ISO 8601 duration string to seconds."""
-        # Example: PT4M13S = 4 minutes 13 seconds
-        import re
-        
-        pattern = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
-        match = pattern.match(duration_str)
+        match = _DURATION_RE.match(duration_str)
         
         if not match:
             return 0
@@ -208,23 +271,24 @@ class YouTubeCollector:
             
             response = self.youtube.channels().list(**channel_params).execute()
             
-            channels = []
-            for item in response["items"]:
-                stats = item["statistics"]
+            items = response["items"]
+            channels = [None] * len(items)
+            for i, item in enumerate(items):
+                subscribers, video_count, views = _parse_counts(item["statistics"], _CHANNEL_COUNT_FIELDS)
                 
                 channel_data = {
                     "channel_id": item["id"],
                     "title": item["snippet"]["title"],
                     "description": item["snippet"]["description"],
                     "created_at": item["snippet"]["publishedAt"],
-                    "subscriber_count": int(stats.get("subscriberCount", 0)),
-                    "video_count": int(stats.get("videoCount", 0)),
-                    "view_count": int(stats.get("viewCount", 0)),
+                    "subscriber_count": subscribers,
+                    "video_count": video_count,
+                    "view_count": views,
                     "country": item["snippet"].get("country"),
                     "custom_url": item["snippet"].get("customUrl"),
                     "thumbnails": item["snippet"]["thumbnails"]
                 }
-                channels.append(channel_data)
+                channels[i] = channel_data
             
             return channels
             
@@ -253,13 +317,11 @@ class YouTubeCollector:
             
             response = self.youtube.videos().list(**trending_params).execute()
             
-            videos = []
-            for item in response["items"]:
+            items = response["items"]
+            videos = [None] * len(items)
+            for i, item in enumerate(items):
                 duration = self._parse_duration(item["contentDetails"]["duration"])
-                stats = item["statistics"]
-                views = int(stats.get("viewCount", 0))
-                likes = int(stats.get("likeCount", 0))
-                comments = int(stats.get("commentCount", 0))
+                views, likes, comments = _parse_counts(item["statistics"], _VIDEO_COUNT_FIELDS)
                 
                 engagement_rate = (likes + comments) / max(views, 1)
                 
@@ -280,7 +342,7 @@ class YouTubeCollector:
                     "tags": item["snippet"].get("tags", []),
                     "is_trending": True
                 }
-                videos.append(video_data)
+                videos[i] = video_data
             
             self.logger.info(f"Collected {len(videos)} trending videos")
             return videos
@@ -292,23 +354,37 @@ class YouTubeCollector:
             self.logger.error(f"Error collecting trending videos: {e}")
             return []
     
+    def filter_by_quality(self, videos: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep videos meeting the configured views, engagement and duration thresholds."""
+        if not videos:
+            return []
+        
+        thresholds = {**self._get_default_config()["data_collection"], **self.config.get("data_collection", {})}
+        
+        mask = _qualification_mask(
+            np.fromiter((v["view_count"] for v in videos), dtype=np.int64, count=len(videos)),
+            np.fromiter((v["like_count"] for v in videos), dtype=np.int64, count=len(videos)),
+            np.fromiter((v["comment_count"] for v in videos), dtype=np.int64, count=len(videos)),
+            np.fromiter((v["duration_seconds"] for v in videos), dtype=np.int64, count=len(videos)),
+            thresholds["min_views"],
+            thresholds["min_engagement_rate"],
+            thresholds["max_duration_minutes"]
+        )
+        
+        return [video for video, keep in zip(videos, mask) if keep]
+    
     def search_by_niche(self, niche: str, max_results: int = 100) -> List[Dict[str, Any]]:
         """Search for videos in a specific niche."""
-        niche_queries = {
-            "tecnologia": ["tecnologia", "programação", "apps", "gadgets", "inteligência artificial"],
-            "educacao": ["educação", "tutorial", "como fazer", "aprender", "curso"],
-            "negocios": ["empreendedorismo", "negócios", "marketing", "vendas", "dinheiro"],
-            "lifestyle": ["lifestyle", "rotina", "dicas", "vida", "bem-estar"],
-            "entretenimento": ["entretenimento", "diversão", "humor", "vlogs", "reacts"]
-        }
-        
-        queries = niche_queries.get(niche, [niche])
+        queries = _NICHE_QUERIES.get(niche, (niche,))
         all_videos = []
         
         results_per_query = max_results // len(queries)
         
+        # Same window for every query of the run
+        published_after = self._default_published_after()
+        
         for query in queries:
-            videos = self.search_videos(query, max_results=results_per_query)
+            videos = self.search_videos(query, max_results=results_per_query, published_after=published_after)
             
             # Get detailed information
             video_ids = [v["video_id"] for v in videos]
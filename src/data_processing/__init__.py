@@ -1,11 +1,31 @@
 """Data processing module for analyzing and processing YouTube scripts."""
 
-from .script_analyzer import ScriptAnalyzer
-from .technique_identifier import TechniqueIdentifier, StructureExtractor, PerformanceCorrelator
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "ScriptAnalyzer": "script_analyzer",
+    "TechniqueIdentifier": "technique_identifier",
+    "StructureExtractor": "technique_identifier",
+    "PerformanceCorrelator": "technique_identifier",
+}
 
 __all__ = [
     "ScriptAnalyzer",
     "TechniqueIdentifier",
     "StructureExtractor",
     "PerformanceCorrelator",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,5 @@
 """Data processing placeholder modules."""
 
-from .script_analyzer import ScriptAnalyzer
-
 class TechniqueIdentifier:
     """Identifies storytelling techniques in scripts."""
     
@@ -5,10 +5,13 @@ This module generates complete scripts based on templates, structures,
 and storytelling techniques.
 """
 
+import re
 import random
 import logging
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Final, Mapping, Optional, Sequence, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import sys
 from pathlib import Path
 
@@ -18,6 +21,165 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from storytelling.technique_database import TechniqueDatabase
 
 
+# Average narration speed used for every duration and length estimate
+WORDS_PER_MINUTE = 150
+
+# Template placeholders such as {topic} or {something shocking}
+_PLACEHOLDER_RE = re.compile(r"\{([a-zA-Z_][\w ]*)\}")
+
+# Punctuation swaps applied by tone, as single-pass translation tables
+_ENTHUSIASTIC_PUNCTUATION = str.maketrans(".", "!")
+_PROFESSIONAL_PUNCTUATION = str.maketrans("!", ".")
+_MUITO_RE = re.compile(r"\bmuito\b")
+
+# Context flags raised when the description mentions any of the keywords.
+# Matched as substrings so plurals and inflections ("problemas", "métodos") count.
+_DESCRIPTION_FOCUS_KEYWORDS = (
+    ("has_problem_focus", ("problema", "dificuldade", "desafio")),
+    ("has_solution_focus", ("solução", "resolver", "método")),
+    ("has_personal_element", ("experiência", "história", "aconteceu"))
+)
+# Words whose presence in a script counts as an engagement element
+_ENGAGEMENT_INDICATORS = ("comentários", "like", "inscreva", "compartilhe")
+# Engagement prompts inserted in the middle sections
+_ENGAGEMENT_PROMPTS = (
+    "Deixe nos comentários: você já passou por isso? Quero saber sua experiência!",
+    "Se você está gostando até aqui, dê aquele like para me ajudar!",
+    "Pausa o vídeo agora e pensa: você realmente faz isso na prática?",
+    "Lembra do que falei no início? Agora você está entendendo o porquê.",
+    "Aguarda que vou te mostrar algo que vai te surpreender..."
+)
+
+# Calls to action for the conclusion
+_CTA_ELEMENTS = (
+    "Se esse vídeo foi útil para você, deixa aquele like.",
+    "Se inscreve no canal se ainda não é inscrito.",
+    "Ativa o sininho para não perder os próximos vídeos.",
+    "E comenta embaixo: qual vai ser seu primeiro passo?"
+)
+
+# Hook context per topic, picked by the first keyword found in the topic.
+# {description} is the first 50 characters of the description, lowercased.
+_TOPIC_CONTEXTS = (
+    (("python", "programação"), {
+        "shocking_with_description": "90% das pessoas que {description}... fazem isso completamente errado",
+        "shocking": "90% das pessoas aprendem programação de forma totalmente errada",
+        "contradicts expectation": "pensam que precisam decorar sintaxe",
+        "topic": "programação",
+        "subject": "aprender código"
+    }),
+    (("negócio", "empreend"), {
+        "shocking_with_description": "95% das pessoas que tentam {description}... falham nos primeiros 6 meses",
+        "shocking": "95% dos negócios online falham nos primeiros 6 meses",
+        "contradicts expectation": "focam no produto errado",
+        "topic": "empreendedorismo",
+        "subject": "construir um negócio"
+    }),
+    (("youtube",), {
+        "shocking_with_description": "apenas 2% dos youtubers que {description}... conseguem viver do canal",
+        "shocking": "apenas 2% dos youtubers conseguem viver do canal",
+        "contradicts expectation": "fazem tudo pensando no algoritmo",
+        "topic": "YouTube",
+        "subject": "crescer no YouTube"
+    })
+)
+
+# Generic context for any other topic
+_GENERIC_TOPIC_CONTEXT = {
+    "shocking_with_description": "a maioria das pessoas que {description}... faz isso de forma completamente errada",
+    "shocking": "a maioria das pessoas não sabe como {topic}",
+    "contradicts expectation": "usam métodos desatualizados",
+    "topic": "{topic}",
+    "subject": "{topic}"
+}
+
+# Tone modifiers for different styles
+_TONE_MODIFIERS: Final[Mapping[str, Mapping[str, Tuple[str, ...]]]] = MappingProxyType({
+    "casual": MappingProxyType({
+        "connectors": ("Olha", "Cara", "Mano", "Galera", "Pessoal"),
+        "emphasis": ("super", "muito", "demais", "pra caramba"),
+        "transitions": ("Agora", "Aí", "Então", "Daí", "Tipo assim")
+    }),
+    "professional": MappingProxyType({
+        "connectors": ("Vamos analisar", "É importante notar", "Considerando"),
+        "emphasis": ("significativamente", "consideravelmente", "extremamente"),
+        "transitions": ("Em seguida", "Posteriormente", "Ademais", "Além disso")
+    }),
+    "enthusiastic": MappingProxyType({
+        "connectors": ("Gente!", "Isso é incrível!", "Olha que incrível!"),
+        "emphasis": ("MUITO", "extremamente", "incrivelmente", "fantasticamente"),
+        "transitions": ("E agora", "E mais", "E tem mais", "Espera que tem mais")
+    }),
+    "educational": MappingProxyType({
+        "connectors": ("Vamos entender", "É fundamental", "Primeiro ponto"),
+        "emphasis": ("claramente", "precisamente", "especificamente"),
+        "transitions": ("Primeiro", "Segundo", "Em terceiro lugar", "Para concluir")
+    })
+})
+
+# Adapters for different audiences
+_AUDIENCE_ADAPTERS: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+    "iniciantes": MappingProxyType({
+        "complexity": "low",
+        "explanations": True,
+        "examples": "basic",
+        "vocabulary": "simple"
+    }),
+    "intermediarios": MappingProxyType({
+        "complexity": "medium", 
+        "explanations": False,
+        "examples": "practical",
+        "vocabulary": "technical"
+    }),
+    "avancados": MappingProxyType({
+        "complexity": "high",
+        "explanations": False,
+        "examples": "advanced",
+        "vocabulary": "expert"
+    }),
+    "geral": MappingProxyType({
+        "complexity": "medium",
+        "explanations": True,
+        "examples": "varied",
+        "vocabulary": "accessible"
+    })
+})
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Tuple[str, ...]:
+    """Split a template once into alternating literal text and placeholder names."""
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+def _render_template(template: str, context: Dict[str, str]) -> str:
+    """Fill a template's placeholders from ``context``, keeping unknown ones as-is."""
+    parts = list(_compile_template(template))
+    for i in range(1, len(parts), 2):
+        name = parts[i]
+        parts[i] = context.get(name, f"{{{name}}}")
+    return "".join(parts)
+
+
+def _setup_logging() -> logging.Logger:
+    """Setup logging for the generator."""
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.INFO)
+    
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+    
+    return logger
+
+
+_LOGGER = _setup_logging()
+
+
 @dataclass
 class ScriptGenerationRequest:
     """Request for script generation."""
@@ -36,6 +198,11 @@ class ScriptGenerationRequest:
 @dataclass
 class GeneratedScript:
     """Generated script with metadata."""
+    __slots__ = (
+        "script_text", "metadata", "techniques_used", "structure_breakdown",
+        "estimated_duration", "quality_score"
+    )
+    
     script_text: str
     metadata: Dict[str, Any]
     techniques_used: List[str]
@@ -47,80 +214,18 @@ class GeneratedScript:
 class ScriptGenerator:
     """Generates YouTube scripts using storytelling techniques."""
     
-    def __init__(self):
+    def __init__(self, structure_cache_size: int = 256, seed: Optional[int] = None):
         self.db = TechniqueDatabase()
-        self.logger = self._setup_logging()
-        self.tone_modifiers = self._initialize_tone_modifiers()
-        self.audience_adapters = self._initialize_audience_adapters()
-    
-    def _setup_logging(self) -> logging.Logger:
-        """Setup logging for the generator."""
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        
-        return logger
-    
-    def _initialize_tone_modifiers(self) -> Dict[str, Dict[str, List[str]]]:
-        """Initialize tone modifiers for different styles."""
-        return {
-            "casual": {
-                "connectors": ["Olha", "Cara", "Mano", "Galera", "Pessoal"],
-                "emphasis": ["super", "muito", "demais", "pra caramba"],
-                "transitions": ["Agora", "Aí", "Então", "Daí", "Tipo assim"]
-            },
-            "professional": {
-                "connectors": ["Vamos analisar", "É importante notar", "Considerando"],
-                "emphasis": ["significativamente", "consideravelmente", "extremamente"],
-                "transitions": ["Em seguida", "Posteriormente", "Ademais", "Além disso"]
-            },
-            "enthusiastic": {
-                "connectors": ["Gente!", "Isso é incrível!", "Olha que incrível!"],
-                "emphasis": ["MUITO", "extremamente", "incrivelmente", "fantasticamente"],
-                "transitions": ["E agora", "E mais", "E tem mais", "Espera que tem mais"]
-            },
-            "educational": {
-                "connectors": ["Vamos entender", "É fundamental", "Primeiro ponto"],
-                "emphasis": ["claramente", "precisamente", "especificamente"],
-                "transitions": ["Primeiro", "Segundo", "Em terceiro lugar", "Para concluir"]
-            }
-        }
-    
-    def _initialize_audience_adapters(self) -> Dict[str, Dict[str, Any]]:
-        """Initialize adapters for different audiences."""
-        return {
-            "iniciantes": {
-                "complexity": "low",
-                "explanations": True,
-                "examples": "basic",
-                "vocabulary": "simple"
-            },
-            "intermediarios": {
-                "complexity": "medium", 
-                "explanations": False,
-                "examples": "practical",
-                "vocabulary": "technical"
-            },
-            "avancados": {
-                "complexity": "high",
-                "explanations": False,
-                "examples": "advanced",
-                "vocabulary": "expert"
-            },
-            "geral": {
-                "complexity": "medium",
-                "explanations": True,
-                "examples": "varied",
-                "vocabulary": "accessible"
-            }
-        }
+        # Own random generator so scripts are reproducible for a given seed
+        self._rng = random.Random(seed)
+        self.logger = _LOGGER
+        self.tone_modifiers = _TONE_MODIFIERS
+        self.audience_adapters = _AUDIENCE_ADAPTERS
+        # Structures are deterministic in their arguments; variations of one
+        # request reuse the same structure instead of rebuilding it
+        self._get_structure = lru_cache(maxsize=structure_cache_size)(
+            self.db.generate_complete_script_structure
+        )
     
     def generate_script(self, request: ScriptGenerationRequest) -> GeneratedScript:
         """Generate a complete script based on the request."""
@@ -128,7 +233,7 @@ class ScriptGenerator:
             self.logger.info(f"Generating script for topic: {request.topic}")
             
             # Get the complete structure
-            structure = self.db.generate_complete_script_structure(
+            structure = self._get_structure(
                 niche=request.niche,
                 hook_type=request.hook_type,
                 structure_type=request.structure_type,
@@ -139,23 +244,28 @@ class ScriptGenerator:
             if not structure:
                 raise ValueError("Could not generate script structure")
             
-            # Generate script content
-            script_sections = self._generate_script_sections(structure, request)
+            # Generate script content; the description is lowercased once per script
+            description_lower = (request.description or "").lower()
+            script_sections = self._generate_script_sections(structure, request, description_lower)
             
             # Assemble final script
-            script_text = self._assemble_script(script_sections, request)
+            script_text, section_count = self._assemble_script(script_sections, request)
+            
+            # Sections are joined by whitespace, so their word counts add up to the script's
+            section_word_counts = [len(content.split()) for _, content in script_sections]
+            word_count = sum(section_word_counts)
             
             # Calculate quality score
-            quality_score = self._calculate_quality_score(script_text, structure)
+            quality_score = self._calculate_quality_score(script_text, structure, word_count, section_count)
             
             # Extract techniques used
             techniques_used = self._extract_techniques_used(structure, request)
             
             # Create structure breakdown
-            structure_breakdown = self._create_structure_breakdown(script_sections)
+            structure_breakdown = self._create_structure_breakdown(script_sections, section_word_counts)
             
             # Estimate duration
-            estimated_duration = len(script_text.split()) / 150  # ~150 words per minute
+            estimated_duration = word_count / WORDS_PER_MINUTE
             
             result = GeneratedScript(
                 script_text=script_text,
@@ -182,148 +292,119 @@ class ScriptGenerator:
             self.logger.error(f"Error generating script: {e}")
             raise
     
-    def _generate_script_sections(self, structure: Dict[str, Any], request: ScriptGenerationRequest) -> Dict[str, str]:
-        """Generate content for each section of the script."""
-        sections = {}
+    def _generate_script_sections(self,
+                                  structure: Dict[str, Any],
+                                  request: ScriptGenerationRequest,
+                                  description_lower: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Generate content for each section of the script, as (key, text) pairs in script order.
+        
+        ``description_lower`` is the lowercased request description, computed here if omitted.
+        """
+        if description_lower is None:
+            description_lower = (request.description or "").lower()
+        
+        sections = []
         
         # Generate hook section
-        sections["hook"] = self._generate_hook_section(structure["hook"], request)
+        sections.append(("hook", self._generate_hook_section(structure["hook"], request, description_lower)))
         
         # Generate main content sections
         for i, section in enumerate(structure["structure"]["sections"]):
             section_key = f"section_{i+1}_{section['name'].lower().replace(' ', '_')}"
-            sections[section_key] = self._generate_content_section(section, request, i+1)
+            sections.append((section_key, self._generate_content_section(section, request, i+1, description_lower)))
         
         # Generate conclusion if requested
         if request.include_cta:
-            sections["conclusion"] = self._generate_conclusion_section(request)
+            sections.append(("conclusion", self._generate_conclusion_section(request)))
         
         return sections
     
-    def _generate_hook_section(self, hook_info: Dict[str, Any], request: ScriptGenerationRequest) -> str:
+    def _generate_hook_section(self,
+                               hook_info: Dict[str, Any],
+                               request: ScriptGenerationRequest,
+                               description_lower: Optional[str] = None) -> str:
         """Generate the hook section."""
         # Get context for hook customization
-        context = self._build_hook_context(request)
+        context = self._build_hook_context(request, description_lower)
         
         # Get base hook template
         hook_template = hook_info["template"]
         
-        # Replace placeholders with context
-        hook_text = hook_template
-        for key, value in context.items():
-            hook_text = hook_text.replace(f"{{{key}}}", value)
+        # Replace placeholders with context; templates are parsed once and cached
+        hook_text = _render_template(hook_template, context)
         
         # Apply tone modifications
         hook_text = self._apply_tone_modifications(hook_text, request.tone)
         
         # Add opening connector based on tone
         connectors = self.tone_modifiers[request.tone]["connectors"]
-        opener = random.choice(connectors)
+        opener = self._rng.choice(connectors)
         
         return f"{opener}, {hook_text}"
     
-    def _build_hook_context(self, request: ScriptGenerationRequest) -> Dict[str, str]:
+    def _build_hook_context(self,
+                            request: ScriptGenerationRequest,
+                            description_lower: Optional[str] = None) -> Dict[str, str]:
         """Build context dictionary for hook customization."""
         context = request.custom_context or {}
         
         # Incorporate user-provided description for better context
         if request.description:
             # Use description to enhance context
-            description_lower = request.description.lower()
+            if description_lower is None:
+                description_lower = request.description.lower()
             context["user_description"] = request.description
             
             # Extract additional context hints from description
-            if any(word in description_lower for word in ["problema", "dificuldade", "desafio"]):
-                context["has_problem_focus"] = "true"
-            if any(word in description_lower for word in ["solução", "resolver", "método"]):
-                context["has_solution_focus"] = "true"
-            if any(word in description_lower for word in ["experiência", "história", "aconteceu"]):
-                context["has_personal_element"] = "true"
+            for flag, keywords in _DESCRIPTION_FOCUS_KEYWORDS:
+                if any(word in description_lower for word in keywords):
+                    context[flag] = "true"
         
         # Add default context based on topic and niche
         topic_lower = request.topic.lower()
-        
-        if "python" in topic_lower or "programação" in topic_lower:
-            if request.description:
-                # Use description to customize the shocking statement
-                context.update({
-                    "something shocking": f"90% das pessoas que {request.description[:50].lower()}... fazem isso completamente errado",
-                    "contradicts expectation": "pensam que precisam decorar sintaxe",
-                    "topic": "programação",
-                    "subject": "aprender código"
-                })
-            else:
-                context.update({
-                    "something shocking": "90% das pessoas aprendem programação de forma totalmente errada",
-                    "contradicts expectation": "pensam que precisam decorar sintaxe",
-                    "topic": "programação",
-                    "subject": "aprender código"
-                })
-        elif "negócio" in topic_lower or "empreend" in topic_lower:
-            if request.description:
-                context.update({
-                    "something shocking": f"95% das pessoas que tentam {request.description[:50].lower()}... falham nos primeiros 6 meses",
-                    "contradicts expectation": "focam no produto errado",
-                    "topic": "empreendedorismo", 
-                    "subject": "construir um negócio"
-                })
-            else:
-                context.update({
-                    "something shocking": "95% dos negócios online falham nos primeiros 6 meses",
-                    "contradicts expectation": "focam no produto errado",
-                    "topic": "empreendedorismo",
-                    "subject": "construir um negócio"
-                })
-        elif "youtube" in topic_lower:
-            if request.description:
-                context.update({
-                    "something shocking": f"apenas 2% dos youtubers que {request.description[:50].lower()}... conseguem viver do canal",
-                    "contradicts expectation": "fazem tudo pensando no algoritmo",
-                    "topic": "YouTube",
-                    "subject": "crescer no YouTube"
-                })
-            else:
-                context.update({
-                    "something shocking": "apenas 2% dos youtubers conseguem viver do canal",
-                    "contradicts expectation": "fazem tudo pensando no algoritmo",
-                    "topic": "YouTube",
-                    "subject": "crescer no YouTube"
-                })
-        else:
-            # Generic context enhanced with description
-            if request.description:
-                context.update({
-                    "something shocking": f"a maioria das pessoas que {request.description[:50].lower()}... faz isso de forma completamente errada",
-                    "contradicts expectation": "usam métodos desatualizados",
-                    "topic": request.topic.lower(),
-                    "subject": request.topic.lower()
-                })
-            else:
-                context.update({
-                    "something shocking": f"a maioria das pessoas não sabe como {request.topic.lower()}",
-                    "contradicts expectation": "usam métodos desatualizados",
-                    "topic": request.topic.lower(),
-                    "subject": request.topic.lower()
-                })
+        template = next(
+            (template for keywords, template in _TOPIC_CONTEXTS
+             if any(keyword in topic_lower for keyword in keywords)),
+            _GENERIC_TOPIC_CONTEXT
+        )
+        
+        # Use description to customize the shocking statement
+        shocking = template["shocking_with_description"] if request.description else template["shocking"]
+        description_slot = request.description[:50].lower() if request.description else ""
+        slots = {"topic": topic_lower, "description": description_slot}
+        
+        context.update({
+            "something shocking": shocking.format(**slots),
+            "contradicts expectation": template["contradicts expectation"],
+            "topic": template["topic"].format(**slots),
+            "subject": template["subject"].format(**slots)
+        })
         
         return context
     
-    def _generate_content_section(self, section_info: Dict[str, Any], request: ScriptGenerationRequest, section_num: int) -> str:
+    def _generate_content_section(self,
+                                  section_info: Dict[str, Any],
+                                  request: ScriptGenerationRequest,
+                                  section_num: int,
+                                  description_lower: Optional[str] = None) -> str:
         """Generate content for a main section."""
         purpose = section_info["purpose"]
         key_elements = section_info["key_elements"]
         duration_percentage = section_info["duration_percentage"]
         
         # Calculate target word count for this section
-        total_words = request.target_duration * 150  # 150 words per minute
+        total_words = request.target_duration * WORDS_PER_MINUTE
         section_words = int(total_words * duration_percentage)
         
         # Generate content based on section purpose and elements
         content_parts = []
         
+        # Tone lookups are shared by every element of the section
+        tone_modifiers = self.tone_modifiers[request.tone]
+        emphasis = tone_modifiers["emphasis"]
+        
         # Add section transition
-        transitions = self.tone_modifiers[request.tone]["transitions"]
-        transition = random.choice(transitions)
+        transition = self._rng.choice(tone_modifiers["transitions"])
         content_parts.append(f"{transition},")
         
         # Generate content for each key element
@@ -331,7 +412,7 @@ class ScriptGenerator:
         
         for element in key_elements:
             element_content = self._generate_element_content(
-                element, purpose, request, words_per_element
+                element, purpose, request, words_per_element, emphasis, description_lower
             )
             content_parts.append(element_content)
         
@@ -342,65 +423,76 @@ class ScriptGenerator:
         
         return " ".join(content_parts)
     
-    def _generate_element_content(self, element: str, purpose: str, request: ScriptGenerationRequest, target_words: int) -> str:
-        """Generate content for a specific element."""
+    def _generate_element_content(self,
+                                  element: str,
+                                  purpose: str,
+                                  request: ScriptGenerationRequest,
+                                  target_words: int,
+                                  emphasis: Optional[Sequence[str]] = None,
+                                  description_lower: Optional[str] = None) -> str:
+        """Generate content for a specific element.
+        
+        ``emphasis`` is the tone's emphasis word list and ``description_lower`` the
+        lowercased description; both are derived from the request if omitted.
+        """
         # This is a simplified content generation
         # In a real implementation, this could use templates or even AI models
         
         topic = request.topic.lower()
-        audience_level = self.audience_adapters[request.target_audience]["complexity"]
-        description_context = f" {request.description}" if request.description else ""
-        
-        if "problema" in element.lower():
-            if "python" in topic:
-                if request.description:
-                    return f"O maior problema que vejo é que as pessoas tentam {request.description.lower()}, mas fazem isso decorando sintaxe. Isso não funciona porque programação não é sobre decorar, é sobre resolver problemas. Você passa horas tentando lembrar como escrever um loop, quando deveria estar focando em entender a lógica por trás."
-                else:
-                    return f"O maior problema que vejo é que as pessoas tentam aprender Python decorando sintaxe. Isso não funciona porque programação não é sobre decorar, é sobre resolver problemas. Você passa horas tentando lembrar como escrever um loop, quando deveria estar focando em entender a lógica por trás."
-            else:
-                base_problem = f"O principal problema com {topic}"
-                if request.description:
-                    return f"{base_problem} é que quando você {request.description.lower()}, a maioria das pessoas aborda de forma completamente errada. Elas focam nos detalhes técnicos sem entender os fundamentos."
-                else:
-                    return f"{base_problem} é que a maioria das pessoas aborda de forma completamente errada. Elas focam nos detalhes técnicos sem entender os fundamentos."
-        
-        elif "solução" in element.lower():
-            if request.description:
-                return f"A solução que descobri muda tudo. Em vez de {topic} da forma tradicional, especialmente quando você {request.description.lower()}, você precisa começar com uma abordagem diferente. Vou te mostrar exatamente como fazer isso."
-            else:
-                return f"A solução que descobri muda tudo. Em vez de {topic} da forma tradicional, você precisa começar com uma abordagem diferente. Vou te mostrar exatamente como fazer isso."
-        
-        elif "exemplo" in element.lower() or "demonstração" in element.lower():
-            if request.description:
-                return f"Deixe-me te mostrar um exemplo prático. Quando eu estava {request.description.lower()}, cometi esse mesmo erro. Mas depois que descobri essa técnica, tudo ficou mais claro."
-            else:
-                return f"Deixe-me te mostrar um exemplo prático. Quando eu estava aprendendo {topic}, cometi esse mesmo erro. Mas depois que descobri essa técnica, tudo ficou mais claro."
-        
-        elif "resultado" in element.lower():
-            if request.description:
-                return f"Os resultados foram impressionantes. Em apenas algumas semanas aplicando essa metodologia para {request.description.lower()}, consegui {topic} de forma muito mais eficiente."
-            else:
-                return f"Os resultados foram impressionantes. Em apenas algumas semanas aplicando essa metodologia, consegui {topic} de forma muito mais eficiente."
+        element_lower = element.lower()
+        if description_lower is None:
+            description_lower = (request.description or "").lower()
+        
+        for keyword, handler in self._ELEMENT_HANDLERS:
+            if keyword in element_lower:
+                return handler(self, topic, description_lower)
         
+        if emphasis is None:
+            emphasis = self.tone_modifiers[request.tone]["emphasis"]
+        return self._generic_content(topic, description_lower, emphasis)
+    
+    def _problem_content(self, topic: str, description: str) -> str:
+        """Content for problem elements."""
+        if "python" in topic:
+            attempt = f"{description}, mas fazem isso" if description else "aprender Python"
+            return f"O maior problema que vejo é que as pessoas tentam {attempt} decorando sintaxe. Isso não funciona porque programação não é sobre decorar, é sobre resolver problemas. Você passa horas tentando lembrar como escrever um loop, quando deveria estar focando em entender a lógica por trás."
         else:
-            # Generic content generation enhanced with description
-            emphasis = random.choice(self.tone_modifiers[request.tone]["emphasis"])
-            if request.description:
-                return f"Isso é {emphasis} importante para {topic}, especialmente quando você {request.description.lower()}. A diferença está nos detalhes e na forma como você aborda cada etapa do processo."
-            else:
-                return f"Isso é {emphasis} importante para {topic}. A diferença está nos detalhes e na forma como você aborda cada etapa do processo."
+            when = f"quando você {description}, " if description else ""
+            return f"O principal problema com {topic} é que {when}a maioria das pessoas aborda de forma completamente errada. Elas focam nos detalhes técnicos sem entender os fundamentos."
+    
+    def _solution_content(self, topic: str, description: str) -> str:
+        """Content for solution elements."""
+        especially = f" especialmente quando você {description}," if description else ""
+        return f"A solução que descobri muda tudo. Em vez de {topic} da forma tradicional,{especially} você precisa começar com uma abordagem diferente. Vou te mostrar exatamente como fazer isso."
+    
+    def _example_content(self, topic: str, description: str) -> str:
+        """Content for example and demonstration elements."""
+        doing = description or f"aprendendo {topic}"
+        return f"Deixe-me te mostrar um exemplo prático. Quando eu estava {doing}, cometi esse mesmo erro. Mas depois que descobri essa técnica, tudo ficou mais claro."
+    
+    def _result_content(self, topic: str, description: str) -> str:
+        """Content for result elements."""
+        purpose = f" para {description}" if description else ""
+        return f"Os resultados foram impressionantes. Em apenas algumas semanas aplicando essa metodologia{purpose}, consegui {topic} de forma muito mais eficiente."
+    
+    def _generic_content(self, topic: str, description: str, emphasis_words: Sequence[str]) -> str:
+        """Generic content, enhanced with the description."""
+        emphasis = self._rng.choice(emphasis_words)
+        especially = f", especialmente quando você {description}" if description else ""
+        return f"Isso é {emphasis} importante para {topic}{especially}. A diferença está nos detalhes e na forma como você aborda cada etapa do processo."
+    
+    # Element keyword -> content handler, checked in order against the element name
+    _ELEMENT_HANDLERS = (
+        ("problema", _problem_content),
+        ("solução", _solution_content),
+        ("exemplo", _example_content),
+        ("demonstração", _example_content),
+        ("resultado", _result_content)
+    )
     
     def _generate_engagement_element(self, request: ScriptGenerationRequest) -> str:
         """Generate an engagement element."""
-        engagement_types = [
-            "Deixe nos comentários: você já passou por isso? Quero saber sua experiência!",
-            "Se você está gostando até aqui, dê aquele like para me ajudar!",
-            "Pausa o vídeo agora e pensa: você realmente faz isso na prática?",
-            "Lembra do que falei no início? Agora você está entendendo o porquê.",
-            "Aguarda que vou te mostrar algo que vai te surpreender..."
-        ]
-        
-        return random.choice(engagement_types)
+        return self._rng.choice(_ENGAGEMENT_PROMPTS)
     
     def _generate_conclusion_section(self, request: ScriptGenerationRequest) -> str:
         """Generate the conclusion section with CTA."""
@@ -412,16 +504,8 @@ class ScriptGenerator:
         # Key takeaway
         conclusion_parts.append("O mais importante é que você comece a aplicar isso hoje mesmo.")
         
-        # CTA elements
-        cta_elements = [
-            "Se esse vídeo foi útil para você, deixa aquele like.",
-            "Se inscreve no canal se ainda não é inscrito.",
-            "Ativa o sininho para não perder os próximos vídeos.",
-            "E comenta embaixo: qual vai ser seu primeiro passo?"
-        ]
-        
-        # Add 2-3 CTA elements
-        selected_ctas = random.sample(cta_elements, k=random.randint(2, 3))
+        # Add 2-3 CTA elements, with even odds (one float draw instead of randint)
+        selected_ctas = self._rng.sample(_CTA_ELEMENTS, k=2 + (self._rng.random() < 0.5))
         conclusion_parts.extend(selected_ctas)
         
         # Closing
@@ -433,67 +517,55 @@ class ScriptGenerator:
         """Apply tone-specific modifications to text."""
         if tone == "enthusiastic":
             # Add more exclamation marks
-            text = text.replace(".", "!")
+            text = text.translate(_ENTHUSIASTIC_PUNCTUATION)
             # Add emphasis words
-            text = text.replace(" muito ", " MUITO ")
+            text = _MUITO_RE.sub("MUITO", text)
         
         elif tone == "professional":
             # Ensure proper punctuation
-            text = text.replace("!", ".")
+            text = text.translate(_PROFESSIONAL_PUNCTUATION)
             # Add professional connectors
             if not text.startswith(("É importante", "Devemos", "Precisamos")):
                 text = "É importante notar que " + text.lower()
         
         return text
     
-    def _assemble_script(self, sections: Dict[str, str], request: ScriptGenerationRequest) -> str:
-        """Assemble the final script from sections."""
-        script_parts = []
-        
-        # Add sections in order
-        if "hook" in sections:
-            script_parts.append(sections["hook"])
-            script_parts.append("")  # Empty line for spacing
-        
-        # Add main content sections
-        section_keys = [k for k in sections.keys() if k.startswith("section_")]
-        section_keys.sort()  # Ensure proper order
-        
-        for key in section_keys:
-            script_parts.append(sections[key])
-            script_parts.append("")  # Empty line for spacing
-        
-        # Add conclusion
-        if "conclusion" in sections:
-            script_parts.append(sections["conclusion"])
-        
-        return "\n".join(script_parts)
+    def _assemble_script(self, sections: List[Tuple[str, str]], request: ScriptGenerationRequest) -> Tuple[str, int]:
+        """Assemble the final script from sections.
+        
+        Returns the script text and the number of sections it contains.
+        """
+        # Sections are already in script order and separated by an empty line
+        script_parts = [content for _, content in sections if content]
+        return "\n\n".join(script_parts), len(script_parts)
     
-    def _calculate_quality_score(self, script_text: str, structure: Dict[str, Any]) -> float:
-        """Calculate a quality score for the generated script."""
+    def _calculate_quality_score(self,
+                                 script_text: str,
+                                 structure: Dict[str, Any],
+                                 words: int,
+                                 script_sections: int) -> float:
+        """Calculate a quality score for a script of ``words`` words in ``script_sections`` sections."""
         score = 0.0
         
         # Word count appropriateness (25%)
-        words = len(script_text.split())
-        target_words = structure["metadata"]["estimated_length"] * 150
+        target_words = structure["metadata"]["estimated_length"] * WORDS_PER_MINUTE
         word_score = 1.0 - abs(words - target_words) / target_words
         score += max(word_score, 0) * 0.25
         
         # Structure completeness (25%)
         required_sections = len(structure["structure"]["sections"]) + 2  # +hook +conclusion
-        script_sections = script_text.count("\n\n") + 1
         structure_score = min(script_sections / required_sections, 1.0)
         score += structure_score * 0.25
         
         # Engagement elements (25%)
-        engagement_indicators = ["comentários", "like", "inscreva", "compartilhe"]
-        engagement_count = sum(1 for indicator in engagement_indicators if indicator in script_text.lower())
+        lower_text = script_text.lower()
+        engagement_count = sum(1 for indicator in _ENGAGEMENT_INDICATORS if indicator in lower_text)
         engagement_score = min(engagement_count / 4, 1.0)
         score += engagement_score * 0.25
         
         # Readability (25%)
-        sentences = script_text.split('.')
-        avg_words_per_sentence = words / len(sentences) if sentences else 0
+        n_sentences = script_text.count('.') + 1  # Same as len(script_text.split('.'))
+        avg_words_per_sentence = words / n_sentences
         if 10 <= avg_words_per_sentence <= 20:
             readability_score = 1.0
         else:
@@ -520,41 +592,39 @@ class ScriptGenerator:
         
         return techniques
     
-    def _create_structure_breakdown(self, sections: Dict[str, str]) -> Dict[str, str]:
-        """Create a breakdown of the script structure."""
+    def _create_structure_breakdown(self,
+                                    sections: List[Tuple[str, str]],
+                                    word_counts: Optional[List[int]] = None) -> Dict[str, str]:
+        """Create a breakdown of the script structure.
+        
+        ``word_counts`` are the sections' word counts, if already known.
+        """
+        if word_counts is None:
+            word_counts = [len(content.split()) for _, content in sections]
+        
         breakdown = {}
         
-        for key, content in sections.items():
-            word_count = len(content.split())
-            duration = word_count / 150  # minutes
+        for (key, _), word_count in zip(sections, word_counts):
+            duration = word_count / WORDS_PER_MINUTE  # minutes
             breakdown[key] = f"{word_count} palavras (~{duration:.1f} min)"
         
         return breakdown
     
     def generate_multiple_variations(self, request: ScriptGenerationRequest, count: int = 3) -> List[GeneratedScript]:
-        """Generate multiple variations of a script."""
+        """Generate multiple variations of a script.
+        
+        Variations differ only in their random choices, so they share the
+        cached structure. They run sequentially: generation is pure Python and
+        a thread pool measured slower under the GIL.
+        """
         variations = []
         
         for i in range(count):
             try:
-                # Slightly modify the request for variation
-                varied_request = ScriptGenerationRequest(
-                    topic=request.topic,
-                    niche=request.niche,
-                    hook_type=request.hook_type,
-                    structure_type=request.structure_type,
-                    target_duration=request.target_duration,
-                    tone=request.tone,
-                    target_audience=request.target_audience,
-                    include_cta=request.include_cta,
-                    description=request.description,
-                    custom_context=request.custom_context
-                )
-                
-                script = self.generate_script(varied_request)
+                script = self.generate_script(request)
                 variations.append(script)
                 
             except Exception as e:
                 self.logger.error(f"Error generating variation {i+1}: {e}")
         
-        return variations
\ No newline at end of file
+        return variations
@@ -5,22 +5,34 @@ import sys
 import argparse
 import logging
 from pathlib import Path
+from typing import Optional
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
 
-from storytelling.technique_database import TechniqueDatabase
+def _add_to_path(directory: Path) -> None:
+    """Prepend a directory to sys.path unless it is already on it."""
+    entry = str(directory)
+    if entry not in sys.path:
+        sys.path.insert(0, entry)
 
 
-def setup_logging():
+# Add src to path (already sys.path[0] when run as ``python src/main.py``)
+_add_to_path(Path(__file__).parent)
+
+
+def setup_logging(log_file: Optional[str] = None):
     """Setup logging configuration."""
+    # Leave logging alone when the host (tests, notebooks) already configured it
+    if logging.getLogger().handlers:
+        return
+    
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('youtube_script_ai.log')
-        ]
+        handlers=handlers
     )
 
 
@@ -30,20 +42,21 @@ def main():
     parser.add_argument("--mode", choices=["collect", "train", "generate", "interface"], 
                        default="interface", help="Operation mode")
     parser.add_argument("--config", default="config.yaml", help="Configuration file path")
-    parser.add_argument("--niche", default="tecnologia", help="Content niche")
+    parser.add_argument("--niche", default="tecnologia", type=sys.intern, help="Content niche")
     parser.add_argument("--topic", default="", help="Specific topic for generation")
+    parser.add_argument("--log-file", default=None, help="Also write logs to this file")
     
     args = parser.parse_args()
     
-    setup_logging()
+    setup_logging(args.log_file)
     logger = logging.getLogger(__name__)
     
     logger.info("Starting YouTube Script AI")
-    logger.info(f"Mode: {args.mode}")
+    logger.info("Mode: %s", args.mode)
     
     if args.mode == "interface":
         # Add app directory to path
-        sys.path.insert(0, str(Path(__file__).parent.parent / "app"))
+        _add_to_path(Path(__file__).parent.parent / "app")
         from web_interface import launch_interface
         launch_interface()
     
@@ -82,6 +95,8 @@ def main():
             print(f"\n--- FIM DO SCRIPT ---\n")
         else:
             # Quick generation example
+            from storytelling.technique_database import TechniqueDatabase
+            
             db = TechniqueDatabase()
             structure = db.generate_complete_script_structure(
                 niche=args.niche,
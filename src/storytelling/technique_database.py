@@ -6,19 +6,170 @@ techniques, hooks, structures, and patterns.
 """
 
 import json
-from typing import Dict, List, Any, Optional
+from functools import cached_property, lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; falls back to the stdlib encoder
+    orjson = None
+
 from .hook_techniques import HookTechniques, Hook
 from .narrative_structures import NarrativeStructures, NarrativeStructure  
 from .engagement_patterns import EngagementPatterns, EngagementTechnique
 
 
+def _search_blob(*fields: str) -> str:
+    """Lowercased searchable text; NUL-separated so a query cannot span two fields."""
+    return "\0".join(field.lower() for field in fields)
+
+
+# Searchable text per technique, built once from the shared tables
+_HOOK_SEARCH: Tuple[Tuple[Hook, str], ...] = tuple(
+    (hook, _search_blob(hook.name, hook.description, *hook.best_niches))
+    for hook in HookTechniques().get_all_hooks().values()
+)
+_STRUCTURE_SEARCH: Tuple[Tuple[NarrativeStructure, str], ...] = tuple(
+    (structure, _search_blob(structure.name, structure.description, *structure.best_for))
+    for structure in NarrativeStructures().get_all_structures().values()
+)
+_PATTERN_SEARCH: Tuple[Tuple[EngagementTechnique, str], ...] = tuple(
+    (pattern, _search_blob(pattern.name, pattern.description, pattern.when_to_use))
+    for pattern in EngagementPatterns().get_all_techniques().values()
+)
+
+
+@lru_cache(maxsize=256)
+def _section_durations(structure_type: str, video_length: int) -> Tuple[str, ...]:
+    """Estimated duration label of each section of a structure at a video length."""
+    structure = NarrativeStructures().get_structure(structure_type)
+    return tuple(f"{section.duration_percentage * video_length:.1f} minutos" for section in structure.sections)
+
+
+@lru_cache(maxsize=1)
+def _technique_statistics() -> Dict[str, Any]:
+    """Counts and distinct types/niches of the shared tables, one pass per table."""
+    hooks = HookTechniques().get_all_hooks()
+    hook_types, niches = set(), set()
+    for hook in hooks.values():
+        hook_types.add(hook.hook_type)
+        niches.update(hook.best_niches)
+    
+    structures = NarrativeStructures().get_all_structures()
+    patterns = EngagementPatterns().get_all_techniques()
+    return {
+        "total_hooks": len(hooks),
+        "total_structures": len(structures),
+        "total_patterns": len(patterns),
+        "hook_types": tuple(hook_types),
+        "structure_types": tuple({structure.structure_type for structure in structures.values()}),
+        "pattern_types": tuple({pattern.technique_type for pattern in patterns.values()}),
+        "supported_niches": tuple(niches),
+    }
+
+
+@lru_cache(maxsize=1024)
+def _validate_combination(hook_type: str, structure_type: str,
+                          niche: str) -> Optional[Tuple[float, bool, bool, Tuple[str, ...]]]:
+    """Score, niche compatibility and recommendation lines for a combination, if it exists."""
+    hook = HookTechniques().get_hook(hook_type)
+    structure = NarrativeStructures().get_structure(structure_type)
+    
+    if not hook or not structure:
+        return None
+    
+    # Check if niche is compatible
+    hook_compatible = niche in hook.best_niches
+    structure_compatible = niche in structure.best_for
+    
+    score = (hook.effectiveness_score + structure.engagement_score) / 2
+    
+    recommendations = (
+        f"Hook effectiveness: {hook.effectiveness_score:.2f}",
+        f"Structure engagement: {structure.engagement_score:.2f}",
+        f"Combined score: {score:.2f}",
+        f"Niche compatibility: Hook={hook_compatible}, Structure={structure_compatible}"
+    )
+    return score, hook_compatible, structure_compatible, recommendations
+
+
+@lru_cache(maxsize=1)
+def _export_document() -> bytes:
+    """The full technique export, encoded once since the shared tables never change."""
+    data = {
+        "hooks": {
+            name: {
+                "name": hook.name,
+                "type": hook.hook_type,
+                "description": hook.description,
+                "template": hook.template,
+                "examples": hook.examples,
+                "effectiveness_score": hook.effectiveness_score,
+                "best_niches": hook.best_niches,
+                "psychological_principle": hook.psychological_principle
+            }
+            for name, hook in HookTechniques().get_all_hooks().items()
+        },
+        "structures": {
+            name: {
+                "name": structure.name,
+                "type": structure.structure_type,
+                "description": structure.description,
+                "sections": [
+                    {
+                        "name": section.name,
+                        "purpose": section.purpose,
+                        "duration_percentage": section.duration_percentage,
+                        "key_elements": section.key_elements,
+                        "examples": section.examples
+                    }
+                    for section in structure.sections
+                ],
+                "best_for": structure.best_for,
+                "engagement_score": structure.engagement_score,
+                "typical_duration": structure.typical_duration,
+                "psychological_principle": structure.psychological_principle
+            }
+            for name, structure in NarrativeStructures().get_all_structures().items()
+        },
+        "patterns": {
+            name: {
+                "name": pattern.name,
+                "type": pattern.technique_type,
+                "description": pattern.description,
+                "when_to_use": pattern.when_to_use,
+                "template": pattern.template,
+                "examples": pattern.examples,
+                "effectiveness_score": pattern.effectiveness_score,
+                "timing_recommendations": pattern.timing_recommendations
+            }
+            for name, pattern in EngagementPatterns().get_all_techniques().items()
+        }
+    }
+    
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
 class TechniqueDatabase:
     """Central database for all storytelling techniques."""
     
-    def __init__(self):
-        self.hooks = HookTechniques()
-        self.structures = NarrativeStructures()
-        self.patterns = EngagementPatterns()
+    # Managers are created on first use; their tables are shared and built at import
+    @cached_property
+    def hooks(self) -> HookTechniques:
+        """Hook techniques manager."""
+        return HookTechniques()
+    
+    @cached_property
+    def structures(self) -> NarrativeStructures:
+        """Narrative structures manager."""
+        return NarrativeStructures()
+    
+    @cached_property
+    def patterns(self) -> EngagementPatterns:
+        """Engagement patterns manager."""
+        return EngagementPatterns()
     
     def search_techniques(self, query: str, category: Optional[str] = None) -> Dict[str, List[Any]]:
         """Search for techniques across all categories."""
@@ -32,27 +183,15 @@ class TechniqueDatabase:
         
         # Search hooks
         if not category or category == "hooks":
-            for hook in self.hooks.get_all_hooks().values():
-                if (query_lower in hook.name.lower() or 
-                    query_lower in hook.description.lower() or
-                    any(query_lower in niche.lower() for niche in hook.best_niches)):
-                    results["hooks"].append(hook)
+            results["hooks"] = [hook for hook, blob in _HOOK_SEARCH if query_lower in blob]
         
         # Search structures  
         if not category or category == "structures":
-            for structure in self.structures.get_all_structures().values():
-                if (query_lower in structure.name.lower() or
-                    query_lower in structure.description.lower() or
-                    any(query_lower in best_for.lower() for best_for in structure.best_for)):
-                    results["structures"].append(structure)
+            results["structures"] = [structure for structure, blob in _STRUCTURE_SEARCH if query_lower in blob]
         
         # Search patterns
         if not category or category == "patterns":
-            for pattern in self.patterns.get_all_techniques().values():
-                if (query_lower in pattern.name.lower() or
-                    query_lower in pattern.description.lower() or
-                    query_lower in pattern.when_to_use.lower()):
-                    results["patterns"].append(pattern)
+            results["patterns"] = [pattern for pattern, blob in _PATTERN_SEARCH if query_lower in blob]
         
         return results
     
@@ -103,9 +242,11 @@ class TechniqueDatabase:
                         "purpose": section.purpose,
                         "duration_percentage": section.duration_percentage,
                         "key_elements": section.key_elements,
-                        "estimated_duration": f"{section.duration_percentage * video_length:.1f} minutos"
+                        "estimated_duration": estimated_duration
                     }
-                    for section in structure.sections
+                    for section, estimated_duration in zip(
+                        structure.sections, _section_durations(structure_type, video_length)
+                    )
                 ],
                 "psychological_principle": structure.psychological_principle
             },
@@ -127,98 +268,28 @@ class TechniqueDatabase:
     
     def export_to_json(self, file_path: str) -> None:
         """Export all techniques to JSON file."""
-        data = {
-            "hooks": {
-                name: {
-                    "name": hook.name,
-                    "type": hook.hook_type.value,
-                    "description": hook.description,
-                    "template": hook.template,
-                    "examples": hook.examples,
-                    "effectiveness_score": hook.effectiveness_score,
-                    "best_niches": hook.best_niches,
-                    "psychological_principle": hook.psychological_principle
-                }
-                for name, hook in self.hooks.get_all_hooks().items()
-            },
-            "structures": {
-                name: {
-                    "name": structure.name,
-                    "type": structure.structure_type.value,
-                    "description": structure.description,
-                    "sections": [
-                        {
-                            "name": section.name,
-                            "purpose": section.purpose,
-                            "duration_percentage": section.duration_percentage,
-                            "key_elements": section.key_elements,
-                            "examples": section.examples
-                        }
-                        for section in structure.sections
-                    ],
-                    "best_for": structure.best_for,
-                    "engagement_score": structure.engagement_score,
-                    "typical_duration": structure.typical_duration,
-                    "psychological_principle": structure.psychological_principle
-                }
-                for name, structure in self.structures.get_all_structures().items()
-            },
-            "patterns": {
-                name: {
-                    "name": pattern.name,
-                    "type": pattern.technique_type.value,
-                    "description": pattern.description,
-                    "when_to_use": pattern.when_to_use,
-                    "template": pattern.template,
-                    "examples": pattern.examples,
-                    "effectiveness_score": pattern.effectiveness_score,
-                    "timing_recommendations": pattern.timing_recommendations
-                }
-                for name, pattern in self.patterns.get_all_techniques().items()
-            }
-        }
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(file_path, 'wb') as f:
+            f.write(_export_document())
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the technique database."""
+        # The tables are fixed after import, so only the lists are copied per call
         return {
-            "total_hooks": len(self.hooks.get_all_hooks()),
-            "total_structures": len(self.structures.get_all_structures()),
-            "total_patterns": len(self.patterns.get_all_techniques()),
-            "hook_types": list(set(hook.hook_type.value for hook in self.hooks.get_all_hooks().values())),
-            "structure_types": list(set(structure.structure_type.value for structure in self.structures.get_all_structures().values())),
-            "pattern_types": list(set(pattern.technique_type.value for pattern in self.patterns.get_all_techniques().values())),
-            "supported_niches": list(set(
-                niche for hook in self.hooks.get_all_hooks().values() 
-                for niche in hook.best_niches
-            ))
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in _technique_statistics().items()
         }
     
     def validate_combination(self, hook_type: str, structure_type: str, niche: str) -> Dict[str, Any]:
         """Validate if a combination of techniques works well together."""
-        hook = self.hooks.get_hook(hook_type)
-        structure = self.structures.get_structure(structure_type)
-        
-        if not hook or not structure:
+        validation = _validate_combination(hook_type, structure_type, niche)
+        if validation is None:
             return {"valid": False, "reason": "Hook ou estrutura não encontrada"}
         
-        # Check if niche is compatible
-        hook_compatible = niche in hook.best_niches
-        structure_compatible = niche in structure.best_for
-        
-        score = (hook.effectiveness_score + structure.engagement_score) / 2
-        
+        score, hook_compatible, structure_compatible, recommendations = validation
         return {
             "valid": True,
             "compatibility_score": score,
             "hook_compatible": hook_compatible,
             "structure_compatible": structure_compatible,
-            "recommendations": [
-                f"Hook effectiveness: {hook.effectiveness_score:.2f}",
-                f"Structure engagement: {structure.engagement_score:.2f}",
-                f"Combined score: {score:.2f}",
-                f"Niche compatibility: Hook={hook_compatible}, Structure={structure_compatible}"
-            ]
+            "recommendations": list(recommendations)
         }
\ No newline at end of file
@@ -1,10 +1,31 @@
 """Training module for hybrid LLM training pipeline."""
 
-from .hybrid_trainer import HybridTrainer, StorytellingTrainer, DatasetCreator, ModelManager
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "HybridTrainer": "hybrid_trainer",
+    "StorytellingTrainer": "hybrid_trainer",
+    "DatasetCreator": "hybrid_trainer",
+    "ModelManager": "hybrid_trainer",
+}
 
 __all__ = [
     "HybridTrainer",
-    "StorytellingTrainer", 
+    "StorytellingTrainer",
     "DatasetCreator",
     "ModelManager",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
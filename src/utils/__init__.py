@@ -0,0 +1,7 @@
+"""Small helpers shared across the project's packages."""
+
+from .frozen_slots import FrozenSlotsPickleMixin
+
+__all__ = [
+    "FrozenSlotsPickleMixin",
+]
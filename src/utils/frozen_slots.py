@@ -0,0 +1,20 @@
+"""Helpers shared by the frozen, slotted dataclasses of the project."""
+
+from typing import Any, Tuple
+
+
+class FrozenSlotsPickleMixin:
+    """Pickle and copy support for frozen dataclasses that declare ``__slots__``.
+
+    Frozen slotted instances cannot be restored through setattr when unpickled,
+    so the state is the tuple of slot values and is written back with
+    ``object.__setattr__``.
+    """
+    __slots__ = ()
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
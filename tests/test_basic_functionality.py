@@ -2,11 +2,15 @@
 Basic tests for YouTube Script AI functionality.
 """
 
+import copy
+import pickle
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path, once per test session
+SRC_DIR = str(Path(__file__).parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 from storytelling.technique_database import TechniqueDatabase
 from storytelling.hook_techniques import HookTechniques
@@ -109,6 +113,20 @@ class TestStorytellingComponents:
         # Search for problem-related techniques
         results = db.search_techniques("problem")
         assert len(results["structures"]) > 0
+    
+    def test_techniques_survive_pickle_and_deepcopy(self):
+        """Test that the frozen technique records round-trip through pickle and deepcopy."""
+        records = [
+            HookTechniques().get_hook("curiosity_gap"),
+            EngagementPatterns().get_technique("pattern_interrupt"),
+            NarrativeStructures().get_structure("hero_journey"),
+        ]
+        
+        for record in records:
+            for restored in (pickle.loads(pickle.dumps(record)), copy.deepcopy(record)):
+                assert restored == record
+                assert restored is not record
+                assert not hasattr(restored, "__dict__")
 
 
 if __name__ == "__main__":
@@ -139,6 +157,9 @@ if __name__ == "__main__":
         test_class.test_search_functionality()
         print("✅ Search functionality test passed")
         
+        test_class.test_techniques_survive_pickle_and_deepcopy()
+        print("✅ Pickle round-trip test passed")
+        
         print("\n🎉 All tests passed! System is working correctly.")
         
     except Exception as e:
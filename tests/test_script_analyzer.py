@@ -0,0 +1,130 @@
+"""
+Tests for the script analyzer.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path, once per test session
+SRC_DIR = str(Path(__file__).parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from data_processing.script_analyzer import ScriptAnalyzer
+
+
+SAMPLE_SCRIPT = (
+    "Você Já Se Perguntou por que 90% das pessoas erram? Eu descobri que existe um segredo. "
+    "Era uma vez um PROBLEMA que surgiu no meu trabalho. Espera, deixe nos comentários. "
+    "Agora vamos ver como resolver. Depois disso, finalmente consegui o resultado. "
+    "Resumindo: se inscreva no canal e compartilhe com os amigos."
+)
+
+
+class TestScriptAnalyzer:
+    """Test script analysis."""
+
+    def test_analysis_identifies_techniques(self):
+        """Test that hooks, engagement and story elements are detected regardless of case."""
+        analyzer = ScriptAnalyzer()
+        result = analyzer.analyze_script(SAMPLE_SCRIPT, "abc123")
+
+        assert result.video_id == "abc123"
+        assert "question_direct" in result.identified_techniques["hooks"]
+        assert "curiosity_gap" in result.identified_techniques["hooks"]
+        assert "pattern_interrupt" in result.identified_techniques["engagement"]
+        assert "beginning" in result.identified_techniques["story_elements"]
+        assert 0 < result.engagement_score <= 1.0
+
+    def test_analysis_preserves_original_text(self):
+        """Test that the result keeps the caller's script text unchanged."""
+        analyzer = ScriptAnalyzer()
+        result = analyzer.analyze_script(SAMPLE_SCRIPT)
+
+        assert result.script_text == SAMPLE_SCRIPT
+        assert result.video_id == "unknown"
+
+    def test_repeated_scripts_are_cached(self):
+        """Test that re-analyzing a script reuses the cached analysis."""
+        analyzer = ScriptAnalyzer(cache_size=1)
+        first = analyzer.analyze_script(SAMPLE_SCRIPT, "first")
+        second = analyzer.analyze_script(SAMPLE_SCRIPT, "second")
+
+        assert second.video_id == "second"
+        assert second.structure_analysis is first.structure_analysis
+
+        # Oldest entry is evicted once the cache is full
+        analyzer.analyze_script("Outro roteiro qualquer para analisar", "other")
+        third = analyzer.analyze_script(SAMPLE_SCRIPT, "third")
+        assert third.structure_analysis is not first.structure_analysis
+        assert third.structure_analysis == first.structure_analysis
+
+    def test_cached_results_cannot_be_mutated(self):
+        """Test that callers cannot corrupt the cached analysis of a script."""
+        analyzer = ScriptAnalyzer()
+        first = analyzer.analyze_script(SAMPLE_SCRIPT, "a")
+        expected = ScriptAnalyzer(cache_size=0).analyze_script(SAMPLE_SCRIPT, "b")
+
+        with pytest.raises(AttributeError):
+            first.recommendations.append("INJECTED")
+        with pytest.raises(AttributeError):
+            first.identified_techniques.clear()
+        with pytest.raises(TypeError):
+            first.identified_techniques["hooks"] = []
+        with pytest.raises(TypeError):
+            first.quality_metrics["readability"] = 0.0
+
+        second = analyzer.analyze_script(SAMPLE_SCRIPT, "b")
+        assert second == expected
+
+    def test_short_scripts_skip_structure_scan(self):
+        """Test that empty and very short scripts get a zeroed structure analysis."""
+        analyzer = ScriptAnalyzer()
+
+        for script in ("", "Oi", "Você já se perguntou por quê?"):
+            structure = analyzer.analyze_script(script).structure_analysis
+            assert structure["sections"] == 0
+            assert structure["hook_strength"] == 0.0
+            assert structure["narrative_flow"] == 0.0
+
+    def test_multiple_scripts_with_worker_pool(self):
+        """Test that pooled batch analysis matches sequential analysis, in input order."""
+        analyzer = ScriptAnalyzer()
+        scripts = [(f"video_{i}", SAMPLE_SCRIPT * (i + 1)) for i in range(4)]
+
+        sequential = analyzer.analyze_multiple_scripts(scripts)
+        pooled = analyzer.analyze_multiple_scripts(scripts, workers=2)
+
+        assert [r.video_id for r in pooled] == [video_id for video_id, _ in scripts]
+        assert [r.engagement_score for r in pooled] == [r.engagement_score for r in sequential]
+
+
+if __name__ == "__main__":
+    # Run analyzer tests if executed directly
+    test_class = TestScriptAnalyzer()
+
+    print("Running script analyzer tests...")
+
+    try:
+        test_class.test_analysis_identifies_techniques()
+        print("✅ Technique identification test passed")
+
+        test_class.test_analysis_preserves_original_text()
+        print("✅ Original text preservation test passed")
+
+        test_class.test_repeated_scripts_are_cached()
+        print("✅ Analysis cache test passed")
+
+        test_class.test_short_scripts_skip_structure_scan()
+        print("✅ Short script structure test passed")
+
+        test_class.test_multiple_scripts_with_worker_pool()
+        print("✅ Worker pool batch analysis test passed")
+
+        print("\n🎉 All analyzer tests passed!")
+
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
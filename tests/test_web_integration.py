@@ -2,14 +2,20 @@
 Tests for web interface integration with ScriptGenerator.
 """
 
+import os
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path, once per test session
+SRC_DIR = str(Path(__file__).parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 from storytelling.technique_database import TechniqueDatabase
-from generation.script_generator import ScriptGenerator, ScriptGenerationRequest
+from generation.script_generator import ScriptGenerator, ScriptGenerationRequest, WORDS_PER_MINUTE
+
+# Per-test diagnostics are only printed when VERBOSE_TESTS=1
+VERBOSE = os.environ.get("VERBOSE_TESTS") == "1"
 
 
 class TestWebIntegration:
@@ -35,12 +41,13 @@ class TestWebIntegration:
         assert structure["metadata"]["topic"] == "Como aprender Python do zero"
         
         # Create script generation request (new Tab 2 functionality)
+        metadata = structure["metadata"]
         request = ScriptGenerationRequest(
-            topic=structure["metadata"]["topic"],
-            niche=structure["metadata"]["niche"],
-            hook_type=structure["metadata"]["hook_type"],
-            structure_type=structure["metadata"]["structure_type"],
-            target_duration=structure["metadata"]["estimated_length"],
+            topic=metadata["topic"],
+            niche=metadata["niche"],
+            hook_type=metadata["hook_type"],
+            structure_type=metadata["structure_type"],
+            target_duration=metadata["estimated_length"],
             tone="casual",
             target_audience="iniciantes",
             include_cta=True
@@ -62,9 +69,11 @@ class TestWebIntegration:
         assert script.metadata["tone"] == request.tone
         assert script.metadata["target_audience"] == request.target_audience
         
-        print(f"✅ Generated script with {len(script.script_text.split())} words")
-        print(f"✅ Quality score: {script.quality_score:.2f}")
-        print(f"✅ Estimated duration: {script.estimated_duration:.1f} minutes")
+        if VERBOSE:
+            # The duration estimate is the generator's own word count over the speaking rate
+            print(f"✅ Generated script with {round(script.estimated_duration * WORDS_PER_MINUTE)} words")
+            print(f"✅ Quality score: {script.quality_score:.2f}")
+            print(f"✅ Estimated duration: {script.estimated_duration:.1f} minutes")
     
     def test_different_tones_and_audiences(self):
         """Test script generation with different tone and audience combinations."""
@@ -96,7 +105,8 @@ class TestWebIntegration:
             assert script.metadata["target_audience"] == audience
             assert len(script.script_text) > 0
             
-            print(f"✅ Generated script for tone='{tone}', audience='{audience}'")
+            if VERBOSE:
+                print(f"✅ Generated script for tone='{tone}', audience='{audience}'")
     
     def test_script_structure_breakdown(self):
         """Test that generated script has proper structure breakdown."""
@@ -119,20 +129,34 @@ class TestWebIntegration:
         assert len(script.structure_breakdown) > 0
         
         # Should have hook section
-        hook_sections = [k for k in script.structure_breakdown.keys() if "hook" in k]
-        assert len(hook_sections) > 0
+        assert any("hook" in k for k in script.structure_breakdown)
         
         # Should have content sections  
-        content_sections = [k for k in script.structure_breakdown.keys() if "section_" in k]
-        assert len(content_sections) > 0
+        assert any("section_" in k for k in script.structure_breakdown)
         
         # Should have conclusion if CTA is included
-        conclusion_sections = [k for k in script.structure_breakdown.keys() if "conclusion" in k]
-        assert len(conclusion_sections) > 0
+        assert any("conclusion" in k for k in script.structure_breakdown)
+        
+        if VERBOSE:
+            print(f"✅ Script has {len(script.structure_breakdown)} sections")
+            for section, info in script.structure_breakdown.items():
+                print(f"   - {section}: {info}")
+    
+    def test_seeded_generation_is_reproducible(self):
+        """Test that generators with the same seed produce the same script."""
+        request = ScriptGenerationRequest(
+            topic="Como crescer no YouTube",
+            niche="tecnologia",
+            hook_type="curiosity_gap",
+            structure_type="problem_solution",
+            target_duration=8
+        )
         
-        print(f"✅ Script has {len(script.structure_breakdown)} sections")
-        for section, info in script.structure_breakdown.items():
-            print(f"   - {section}: {info}")
+        first = ScriptGenerator(seed=42).generate_script(request)
+        second = ScriptGenerator(seed=42).generate_script(request)
+        
+        assert first.script_text == second.script_text
+        assert first.quality_score == second.quality_score
 
 
 if __name__ == "__main__":
@@ -151,6 +175,9 @@ if __name__ == "__main__":
         test_class.test_script_structure_breakdown()
         print("✅ Script structure breakdown test passed")
         
+        test_class.test_seeded_generation_is_reproducible()
+        print("✅ Seeded generation test passed")
+        
         print("\n🎉 All integration tests passed! Ready for web interface implementation.")
         
     except Exception as e:
@@ -0,0 +1,67 @@
+"""
+Tests for the YouTube collector quality filter.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path, once per test session
+SRC_DIR = str(Path(__file__).parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+pytest.importorskip("googleapiclient")
+pytest.importorskip("youtube_transcript_api")
+
+from data_collection.youtube_collector import YouTubeCollector
+
+
+CONFIG = """
+data_collection:
+  min_views: 10000
+  min_engagement_rate: 0.02
+  max_duration_minutes: 30
+"""
+
+
+def make_video(video_id, views, likes, comments, duration_seconds):
+    """Minimal video record as returned by the collection methods."""
+    return {
+        "video_id": video_id,
+        "view_count": views,
+        "like_count": likes,
+        "comment_count": comments,
+        "duration_seconds": duration_seconds,
+    }
+
+
+class TestQualityFilter:
+    """Test filtering collected videos by the configured thresholds."""
+
+    def make_collector(self, tmp_path):
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(CONFIG, encoding="utf-8")
+        return YouTubeCollector(api_key="test-key", config_path=str(config_path))
+
+    def test_thresholds_are_inclusive(self, tmp_path):
+        """Test that videos exactly on every threshold are kept and those past it are dropped."""
+        collector = self.make_collector(tmp_path)
+        videos = [
+            make_video("on_every_threshold", 10000, 150, 50, 1800),
+            make_video("too_few_views", 9999, 150, 50, 1800),
+            make_video("low_engagement", 10000, 150, 49, 1800),
+            make_video("too_long", 10000, 150, 50, 1801),
+            make_video("no_views", 0, 150, 50, 600),
+        ]
+
+        kept = collector.filter_by_quality(videos)
+
+        assert [video["video_id"] for video in kept] == ["on_every_threshold"]
+        assert kept[0] is videos[0]
+
+    def test_empty_input(self, tmp_path):
+        """Test that filtering no videos returns an empty list."""
+        collector = self.make_collector(tmp_path)
+        assert collector.filter_by_quality([]) == []